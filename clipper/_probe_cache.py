@@ -0,0 +1,82 @@
+"""Persistent cache of ffprobe results"""
+
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+
+CACHE_FILE = Path.home() / ".cache" / "clipper" / "probe.db"
+
+# Entries kept both in memory and on disk; least recently used go first
+MAX_ENTRIES = 2000
+
+# Hot entries skip the database entirely; probes come from several threads
+_memory: OrderedDict[str, tuple[int, int, dict]] = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database, creating it on first use"""
+    CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(CACHE_FILE, timeout=5)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS probe ("
+        "path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, data TEXT)"
+    )
+    return conn
+
+
+def _remember(path: str, size: int, mtime: int, data: dict) -> None:
+    with _memory_lock:
+        _memory[path] = (size, mtime, data)
+        _memory.move_to_end(path)
+        while len(_memory) > MAX_ENTRIES:
+            _memory.popitem(last=False)
+
+
+def lookup(path: str, size: int, mtime: int) -> dict | None:
+    """Return cached probe fields, or None if missing or the file has changed"""
+    with _memory_lock:
+        hit = _memory.get(path)
+        if hit is not None:
+            _memory.move_to_end(path)
+    if hit is not None:
+        return hit[2] if hit[0] == size and hit[1] == mtime else None
+
+    try:
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT size, mtime, data FROM probe WHERE path = ?", (path,)
+            ).fetchone()
+    except (sqlite3.Error, OSError):
+        return None
+
+    if row is None or row[0] != size or row[1] != mtime:
+        return None
+    try:
+        data = json.loads(row[2])
+    except json.JSONDecodeError:
+        return None
+    _remember(path, size, mtime, data)
+    return data
+
+
+def store(path: str, size: int, mtime: int, data: dict) -> None:
+    """Remember probe fields for a file at its current size and mtime"""
+    _remember(path, size, mtime, data)
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO probe (path, size, mtime, data) VALUES (?, ?, ?, ?)",
+                (path, size, mtime, json.dumps(data)),
+            )
+            # REPLACE gives the row a fresh rowid, so the lowest are the stalest
+            conn.execute(
+                "DELETE FROM probe WHERE rowid NOT IN "
+                "(SELECT rowid FROM probe ORDER BY rowid DESC LIMIT ?)",
+                (MAX_ENTRIES,),
+            )
+    except (sqlite3.Error, OSError):
+        pass  # Caching is best-effort; a failed write just means a re-probe
@@ -3,8 +3,6 @@
 import typer
 from pathlib import Path
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.panel import Panel
 from rich.table import Table
 
 from .compress import probe_video, compress
@@ -48,6 +46,9 @@ def comp(
     crf: int = typer.Option(28, "-q", "--crf", help="Quality (0-51, higher = smaller)"),
 ):
     """Compress a video for sharing"""
+    # Only this command draws a progress bar; keep it out of `info` startup
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+
     if not path.exists():
         console.print(f"[red]Error:[/red] File not found: {path}")
         raise typer.Exit(1)
@@ -1,12 +1,16 @@
 """Core video compression functionality"""
 
+import os
 import subprocess
 import json
 import re
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import Callable
 
+from . import _probe_cache
+
 
 @dataclass
 class Preset:
@@ -61,7 +65,14 @@ def detect_preset_from_filename(path: Path) -> Preset | None:
     Detect preset from filename suffix.
     e.g., "vacation-social.mp4" -> social preset
     """
-    stem = path.stem.lower()
+    return _detect_preset(path.stem)
+
+
+# Filename parsers depend only on the stem, and the TUI and watcher ask about
+# the same files repeatedly - memoize them per stem
+@lru_cache(maxsize=1024)
+def _detect_preset(stem: str) -> Preset | None:
+    stem = stem.lower()
     for preset_name in PRESETS:
         if stem.endswith(f"-{preset_name}"):
             return PRESETS[preset_name]
@@ -73,7 +84,12 @@ def detect_special_format(path: Path) -> str | None:
     Detect special format from filename suffix.
     e.g., "video-gif.mp4" -> "gif", "video-loop.mp4" -> "loop"
     """
-    stem = path.stem.lower()
+    return _detect_special_format(path.stem)
+
+
+@lru_cache(maxsize=1024)
+def _detect_special_format(stem: str) -> str | None:
+    stem = stem.lower()
     for fmt in SPECIAL_FORMATS:
         if stem.endswith(f"-{fmt}") or f"-{fmt}-" in stem:
             return fmt
@@ -115,7 +131,12 @@ def parse_trim_from_filename(path: Path) -> tuple[str | None, float | None, floa
           "video-loop-0-3.mp4" -> ("loop", 0.0, 3.0)
           "video-gif-5s.mp4" -> ("gif", 5.0, None)  # start only
     """
-    stem = path.stem.lower()
+    return _parse_trim(path.stem)
+
+
+@lru_cache(maxsize=1024)
+def _parse_trim(stem: str) -> tuple[str | None, float | None, float | None]:
+    stem = stem.lower()
 
     for fmt in SPECIAL_FORMATS:
         # Match patterns like -gif-5s-10s, -gif-5-10, -gif-5s, -loop-0-3
@@ -142,6 +163,13 @@ def parse_trim_from_filename(path: Path) -> tuple[str | None, float | None, floa
     return None, None, None
 
 
+def clear_filename_caches() -> None:
+    """Drop memoized filename parses"""
+    _detect_preset.cache_clear()
+    _detect_special_format.cache_clear()
+    _parse_trim.cache_clear()
+
+
 def _resolve_output_dir(input_path: Path, output_dir: Path | None = None) -> Path:
     """Determine the output directory, avoiding transient locations like /tmp."""
     if output_dir is not None:
@@ -221,8 +249,23 @@ def _keep_smaller(input_path: Path, output_path: Path) -> bool:
     return False
 
 
-def probe_video(path: Path) -> VideoInfo:
-    """Get video metadata using ffprobe"""
+def probe_video(path: Path, stat_result: os.stat_result | None = None) -> VideoInfo:
+    """
+    Get video metadata using ffprobe.
+
+    Results are cached on disk keyed by resolved path, size and mtime, so
+    re-loading an unchanged file skips the ffprobe subprocess. Callers that
+    already hold a fresh stat of the file can pass it as stat_result.
+    """
+    st = stat_result if stat_result is not None else path.stat()
+    cache_key = str(path.resolve())
+    cached = _probe_cache.lookup(cache_key, st.st_size, st.st_mtime_ns)
+    if cached is not None:
+        try:
+            return VideoInfo(path=path, **cached)
+        except TypeError:
+            pass  # Stale cache layout - fall through and re-probe
+
     cmd = [
         "ffprobe", "-v", "quiet",
         "-print_format", "json",
@@ -242,7 +285,7 @@ def probe_video(path: Path) -> VideoInfo:
 
     video_stream = next(s for s in data["streams"] if s["codec_type"] == "video")
 
-    return VideoInfo(
+    info = VideoInfo(
         path=path,
         width=video_stream["width"],
         height=video_stream["height"],
@@ -250,8 +293,13 @@ def probe_video(path: Path) -> VideoInfo:
         bitrate=int(data["format"].get("bit_rate", 0)),
         codec=video_stream["codec_name"],
         fps=eval(video_stream.get("r_frame_rate", "30/1")),
-        size_bytes=path.stat().st_size,
+        size_bytes=st.st_size,
+    )
+    _probe_cache.store(
+        cache_key, st.st_size, st.st_mtime_ns,
+        {f.name: getattr(info, f.name) for f in fields(info) if f.name != "path"},
     )
+    return info
 
 
 def compress(
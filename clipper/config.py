@@ -16,6 +16,14 @@ DEFAULT_CONFIG = """\
 # Subfolders: inbox/, processing/, done/, originals/
 watch_base = "~/Movies/VidTools"
 
+# Seconds between scans when the watch folder is on a network mount
+# (NFS/SMB), where native file events aren't delivered
+poll_interval = 30
+
+# Inbox files compressed at the same time. ffmpeg already spreads one encode
+# across every core, so raise this only on machines with cores to spare
+max_workers = 1
+
 [presets]
 # Default preset when none detected from filename
 # Options: social, web, archive, tiny
@@ -37,6 +45,8 @@ notifications = true
 @dataclass
 class FolderConfig:
     watch_base: Path = field(default_factory=lambda: Path.home() / "Movies" / "VidTools")
+    poll_interval: float = 30.0
+    max_workers: int = 1
 
     @property
     def inbox(self) -> Path:
@@ -82,6 +92,26 @@ def ensure_config_exists() -> Path:
     return CONFIG_FILE
 
 
+def _positive_number(value, default: float) -> float:
+    """Return value as a float if it's a positive finite number, else default"""
+    # bool is an int subclass - `true` isn't a number of seconds
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return default
+    if not 0 < value < float("inf"):
+        return default
+    return float(value)
+
+
+def _positive_int(value, default: int) -> int:
+    """Return value if it's a positive whole number, else default"""
+    # Same rules as _positive_number, but a worker count has to be whole
+    if isinstance(value, bool) or not isinstance(value, int):
+        return default
+    if value <= 0:
+        return default
+    return value
+
+
 def load_config() -> Config:
     """Load configuration from file"""
     ensure_config_exists()
@@ -99,6 +129,14 @@ def load_config() -> Config:
         if "watch_base" in data["folders"]:
             path = Path(data["folders"]["watch_base"]).expanduser()
             config.folders.watch_base = path
+        if "poll_interval" in data["folders"]:
+            config.folders.poll_interval = _positive_number(
+                data["folders"]["poll_interval"], config.folders.poll_interval
+            )
+        if "max_workers" in data["folders"]:
+            config.folders.max_workers = _positive_int(
+                data["folders"]["max_workers"], config.folders.max_workers
+            )
 
     # Presets
     if "presets" in data:
@@ -1,18 +1,26 @@
 """Terminal UI for clipper"""
 
-import math
+import os
+import queue
 import re
+import shutil
 import threading
+import time
+from collections import OrderedDict, deque
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable
 from urllib.parse import unquote, urlparse
 from textual.app import App, ComposeResult
 from textual.screen import Screen
-from textual.containers import Container, Horizontal, Vertical, ScrollableContainer, Center
+from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
 from textual.widgets import (
     Header, Footer, Static, Button, ProgressBar,
-    Input, Label, DataTable, RichLog, Select, Switch, TextArea
+    Input, Label, RichLog, Select, Switch
 )
 from textual.binding import Binding
+from textual.message import Message
+from textual.reactive import reactive
 from textual.theme import Theme
 from rich.text import Text
 
@@ -64,103 +72,140 @@ THEMES = [
 
 # ASCII logo with ANSI colors (green scissors)
 LOGO_ASCII = """\
-\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;13;45;22m.\x1b[0m\x1b[38;2;11;47;21m.\x1b[0m\x1b[38;2;0;11;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;11;0m \x1b[0m\x1b[38;2;10;42;18m.\x1b[0m\x1b[38;2;7;36;14m \x1b[0m\x1b[38;2;0;11;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
-\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;26;79;43m.\x1b[0m\x1b[38;2;35;128;67m;\x1b[0m\x1b[38;2;21;82;41m.\x1b[0m\x1b[38;2;0;11;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;19;70;35m.\x1b[0m\x1b[38;2;28;110;57m,\x1b[0m\x1b[38;2;15;61;29m.\x1b[0m\x1b[38;2;0;10;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
-\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;25;76;41m.\x1b[0m\x1b[38;2;34;127;67m;\x1b[0m\x1b[38;2;33;125;66m;\x1b[0m\x1b[38;2;26;97;50m'\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;26;90;47m'\x1b[0m\x1b[38;2;23;101;51m'\x1b[0m\x1b[38;2;30;118;62m,\x1b[0m\x1b[38;2;14;62;29m.\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
-\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;12;42;19m.\x1b[0m\x1b[38;2;42;142;78m:\x1b[0m\x1b[38;2;33;123;64m;\x1b[0m\x1b[38;2;31;120;63m,\x1b[0m\x1b[38;2;23;91;46m'\x1b[0m\x1b[38;2;28;92;50m'\x1b[0m\x1b[38;2;25;104;54m'\x1b[0m\x1b[38;2;28;113;59m,\x1b[0m\x1b[38;2;33;124;65m;\x1b[0m\x1b[38;2;11;49;22m.\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
-\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;44;139;78m:\x1b[0m\x1b[38;2;32;122;64m;\x1b[0m\x1b[38;2;29;114;59m,\x1b[0m\x1b[38;2;25;106;54m,\x1b[0m\x1b[38;2;30;102;55m'\x1b[0m\x1b[38;2;31;118;62m,\x1b[0m\x1b[38;2;28;112;58m,\x1b[0m\x1b[38;2;33;125;65m;\x1b[0m\x1b[38;2;34;125;66m;\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
-\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;30;93;51m'\x1b[0m\x1b[38;2;32;121;63m;\x1b[0m\x1b[38;2;26;109;56m,\x1b[0m\x1b[38;2;22;94;48m'\x1b[0m\x1b[38;2;42;138;77m:\x1b[0m\x1b[38;2;29;114;59m,\x1b[0m\x1b[38;2;33;124;65m;\x1b[0m\x1b[38;2;37;134;71m;\x1b[0m\x1b[38;2;27;104;54m'\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
-\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;43;138;77m:\x1b[0m\x1b[38;2;33;122;64m;\x1b[0m\x1b[38;2;42;135;76m:\x1b[0m\x1b[38;2;32;121;63m;\x1b[0m\x1b[38;2;35;129;68m;\x1b[0m\x1b[38;2;37;133;70m;\x1b[0m\x1b[38;2;41;143;76m:\x1b[0m\x1b[38;2;13;53;24m.\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
-\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;24;73;40m.\x1b[0m\x1b[38;2;33;112;62m,\x1b[0m\x1b[38;2;69;204;115md\x1b[0m\x1b[38;2;47;155;84mc\x1b[0m\x1b[38;2;50;164;89mc\x1b[0m\x1b[38;2;25;92;47m'\x1b[0m\x1b[38;2;10;50;22m.\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
-\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;68;188;110mo\x1b[0m\x1b[38;2;54;170;93ml\x1b[0m\x1b[38;2;30;117;61m,\x1b[0m\x1b[38;2;36;127;67m;\x1b[0m\x1b[38;2;70;208;115md\x1b[0m\x1b[38;2;9;38;16m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
-\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;11;40;18m.\x1b[0m\x1b[38;2;63;174;102ml\x1b[0m\x1b[38;2;89;253;144m0\x1b[0m\x1b[38;2;82;237;133mk\x1b[0m\x1b[38;2;67;204;113md\x1b[0m\x1b[38;2;71;213;118mx\x1b[0m\x1b[38;2;69;207;115md\x1b[0m\x1b[38;2;24;80;40m.\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
-\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;19;58;30m.\x1b[0m\x1b[38;2;42;118;67m;\x1b[0m\x1b[38;2;66;183;106mo\x1b[0m\x1b[38;2;89;248;143mO\x1b[0m\x1b[38;2;87;251;141mO\x1b[0m\x1b[38;2;84;243;136mO\x1b[0m\x1b[38;2;79;232;129mk\x1b[0m\x1b[38;2;65;195;108md\x1b[0m\x1b[38;2;40;127;68m;\x1b[0m\x1b[38;2;36;118;63m;\x1b[0m\x1b[38;2;46;154;83mc\x1b[0m\x1b[38;2;39;136;73m:\x1b[0m\x1b[38;2;21;83;42m.\x1b[0m\x1b[38;2;10;46;20m.\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
-\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;35;98;56m'\x1b[0m\x1b[38;2;61;167;98ml\x1b[0m\x1b[38;2;86;231;137mk\x1b[0m\x1b[38;2;93;255;149m0\x1b[0m\x1b[38;2;91;255;146m0\x1b[0m\x1b[38;2;88;253;142mO\x1b[0m\x1b[38;2;85;246;138mO\x1b[0m\x1b[38;2;81;236;132mk\x1b[0m\x1b[38;2;75;223;124mx\x1b[0m\x1b[38;2;37;117;62m,\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;51;149;84mc\x1b[0m\x1b[38;2;65;198;109md\x1b[0m\x1b[38;2;55;177;96ml\x1b[0m\x1b[38;2;47;158;85mc\x1b[0m\x1b[38;2;39;139;74m:\x1b[0m\x1b[38;2;31;120;63m,\x1b[0m\x1b[38;2;25;104;53m'\x1b[0m\x1b[38;2;17;81;40m.\x1b[0m\x1b[38;2;10;56;25m.\x1b[0m\x1b[38;2;5;35;13m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
-\x1b[38;2;53;143;84m:\x1b[0m\x1b[38;2;76;205;122mx\x1b[0m\x1b[38;2;60;169;98ml\x1b[0m\x1b[38;2;56;160;91mc\x1b[0m\x1b[38;2;63;180;102mo\x1b[0m\x1b[38;2;81;230;130mk\x1b[0m\x1b[38;2;88;252;142mO\x1b[0m\x1b[38;2;84;244;136mO\x1b[0m\x1b[38;2;78;231;129mk\x1b[0m\x1b[38;2;71;214;119mx\x1b[0m\x1b[38;2;40;129;69m;\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;56;161;92ml\x1b[0m\x1b[38;2;63;193;106mo\x1b[0m\x1b[38;2;54;173;94ml\x1b[0m\x1b[38;2;45;151;81mc\x1b[0m\x1b[38;2;35;130;68m;\x1b[0m\x1b[38;2;24;100;51m'\x1b[0m\x1b[38;2;14;66;32m.\x1b[0m\x1b[38;2;9;51;23m.\x1b[0m\x1b[38;2;7;48;21m.\x1b[0m\x1b[38;2;7;52;23m.\x1b[0m\x1b[38;2;6;47;20m.\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
-\x1b[38;2;77;205;123mx\x1b[0m\x1b[38;2;30;91;49m'\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;32;99;52m'\x1b[0m\x1b[38;2;76;225;125mk\x1b[0m\x1b[38;2;70;211;117mx\x1b[0m\x1b[38;2;58;183;100mo\x1b[0m\x1b[38;2;11;48;22m.\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;22;67;36m.\x1b[0m\x1b[38;2;70;210;117mx\x1b[0m\x1b[38;2;58;184;101mo\x1b[0m\x1b[38;2;47;156;84mc\x1b[0m\x1b[38;2;15;59;28m.\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;6;50;22m.\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
-\x1b[38;2;57;150;90mc\x1b[0m\x1b[38;2;38;113;63m,\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;39;114;63m,\x1b[0m\x1b[38;2;60;189;104mo\x1b[0m\x1b[38;2;39;135;71m:\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;67;193;111md\x1b[0m\x1b[38;2;62;193;106mo\x1b[0m\x1b[38;2;31;107;56m,\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;18;87;43m.\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
-\x1b[38;2;54;146;86mc\x1b[0m\x1b[38;2;32;98;52m'\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;44;126;72m;\x1b[0m\x1b[38;2;45;153;83mc\x1b[0m\x1b[38;2;13;57;26m.\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;28;84;45m.\x1b[0m\x1b[38;2;67;204;113md\x1b[0m\x1b[38;2;43;141;76m:\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;14;55;25m.\x1b[0m\x1b[38;2;36;128;69m;\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
-\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;65;182;106mo\x1b[0m\x1b[38;2;21;69;35m.\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;8;32;13m \x1b[0m\x1b[38;2;40;117;66m;\x1b[0m\x1b[38;2;49;158;87mc\x1b[0m\x1b[38;2;14;62;30m.\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;31;98;52m'\x1b[0m\x1b[38;2;61;189;104mo\x1b[0m\x1b[38;2;35;118;63m;\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;29;88;49m'\x1b[0m\x1b[38;2;6;37;15m \x1b[0m\x1b[38;2;57;164;97ml\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
-\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;34;104;56m,\x1b[0m\x1b[38;2;44;134;72m:\x1b[0m\x1b[38;2;42;131;70m;\x1b[0m\x1b[38;2;45;139;75m:\x1b[0m\x1b[38;2;48;148;80m:\x1b[0m\x1b[38;2;46;143;78m:\x1b[0m\x1b[38;2;21;79;40m.\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;7;33;12m \x1b[0m\x1b[38;2;26;89;45m'\x1b[0m\x1b[38;2;34;116;61m,\x1b[0m\x1b[38;2;29;104;54m,\x1b[0m\x1b[38;2;23;87;44m.\x1b[0m\x1b[38;2;25;91;46m'\x1b[0m\x1b[38;2;34;112;60m,\x1b[0m\x1b[38;2;23;78;41m.\x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m\x1b[38;2;0;12;0m \x1b[0m
+           \x1b[38;2;13;45;22m.\x1b[0m\x1b[38;2;11;47;21m.\x1b[0m    \x1b[38;2;10;42;18m.\x1b[0m           
+           \x1b[38;2;26;79;43m.\x1b[0m\x1b[38;2;35;128;67m;\x1b[0m\x1b[38;2;21;82;41m.\x1b[0m  \x1b[38;2;19;70;35m.\x1b[0m\x1b[38;2;28;110;57m,\x1b[0m\x1b[38;2;15;61;29m.\x1b[0m          
+           \x1b[38;2;25;76;41m.\x1b[0m\x1b[38;2;34;127;67m;\x1b[0m\x1b[38;2;33;125;66m;\x1b[0m\x1b[38;2;26;97;50m'\x1b[0m \x1b[38;2;26;90;47m'\x1b[0m\x1b[38;2;23;101;51m'\x1b[0m\x1b[38;2;30;118;62m,\x1b[0m\x1b[38;2;14;62;29m.\x1b[0m         
+          \x1b[38;2;12;42;19m.\x1b[0m\x1b[38;2;42;142;78m:\x1b[0m\x1b[38;2;33;123;64m;\x1b[0m\x1b[38;2;31;120;63m,\x1b[0m\x1b[38;2;23;91;46m'\x1b[0m\x1b[38;2;28;92;50m'\x1b[0m\x1b[38;2;25;104;54m'\x1b[0m\x1b[38;2;28;113;59m,\x1b[0m\x1b[38;2;33;124;65m;\x1b[0m\x1b[38;2;11;49;22m.\x1b[0m         
+           \x1b[38;2;44;139;78m:\x1b[0m\x1b[38;2;32;122;64m;\x1b[0m\x1b[38;2;29;114;59m,\x1b[0m\x1b[38;2;25;106;54m,\x1b[0m\x1b[38;2;30;102;55m'\x1b[0m\x1b[38;2;31;118;62m,\x1b[0m\x1b[38;2;28;112;58m,\x1b[0m\x1b[38;2;33;125;65m;\x1b[0m\x1b[38;2;34;125;66m;\x1b[0m         
+          \x1b[38;2;30;93;51m'\x1b[0m\x1b[38;2;32;121;63m;\x1b[0m\x1b[38;2;26;109;56m,\x1b[0m\x1b[38;2;22;94;48m'\x1b[0m\x1b[38;2;42;138;77m:\x1b[0m\x1b[38;2;29;114;59m,\x1b[0m\x1b[38;2;33;124;65m;\x1b[0m\x1b[38;2;37;134;71m;\x1b[0m\x1b[38;2;27;104;54m'\x1b[0m          
+           \x1b[38;2;43;138;77m:\x1b[0m\x1b[38;2;33;122;64m;\x1b[0m\x1b[38;2;42;135;76m:\x1b[0m\x1b[38;2;32;121;63m;\x1b[0m\x1b[38;2;35;129;68m;\x1b[0m\x1b[38;2;37;133;70m;\x1b[0m\x1b[38;2;41;143;76m:\x1b[0m\x1b[38;2;13;53;24m.\x1b[0m          
+          \x1b[38;2;24;73;40m.\x1b[0m\x1b[38;2;33;112;62m,\x1b[0m\x1b[38;2;69;204;115md\x1b[0m\x1b[38;2;47;155;84mc\x1b[0m\x1b[38;2;50;164;89mc\x1b[0m\x1b[38;2;25;92;47m'\x1b[0m\x1b[38;2;10;50;22m.\x1b[0m            
+           \x1b[38;2;68;188;110mo\x1b[0m\x1b[38;2;54;170;93ml\x1b[0m\x1b[38;2;30;117;61m,\x1b[0m\x1b[38;2;36;127;67m;\x1b[0m\x1b[38;2;70;208;115md\x1b[0m             
+        \x1b[38;2;11;40;18m.\x1b[0m\x1b[38;2;63;174;102ml\x1b[0m\x1b[38;2;89;253;144m0\x1b[0m\x1b[38;2;82;237;133mk\x1b[0m\x1b[38;2;67;204;113md\x1b[0m\x1b[38;2;71;213;118mx\x1b[0m\x1b[38;2;69;207;115md\x1b[0m\x1b[38;2;24;80;40m.\x1b[0m             
+    \x1b[38;2;19;58;30m.\x1b[0m\x1b[38;2;42;118;67m;\x1b[0m\x1b[38;2;66;183;106mo\x1b[0m\x1b[38;2;89;248;143mO\x1b[0m\x1b[38;2;87;251;141mO\x1b[0m\x1b[38;2;84;243;136mO\x1b[0m\x1b[38;2;79;232;129mk\x1b[0m\x1b[38;2;65;195;108md\x1b[0m\x1b[38;2;40;127;68m;\x1b[0m\x1b[38;2;36;118;63m;\x1b[0m\x1b[38;2;46;154;83mc\x1b[0m\x1b[38;2;39;136;73m:\x1b[0m\x1b[38;2;21;83;42m.\x1b[0m\x1b[38;2;10;46;20m.\x1b[0m           
+ \x1b[38;2;35;98;56m'\x1b[0m\x1b[38;2;61;167;98ml\x1b[0m\x1b[38;2;86;231;137mk\x1b[0m\x1b[38;2;93;255;149m0\x1b[0m\x1b[38;2;91;255;146m0\x1b[0m\x1b[38;2;88;253;142mO\x1b[0m\x1b[38;2;85;246;138mO\x1b[0m\x1b[38;2;81;236;132mk\x1b[0m\x1b[38;2;75;223;124mx\x1b[0m\x1b[38;2;37;117;62m,\x1b[0m \x1b[38;2;51;149;84mc\x1b[0m\x1b[38;2;65;198;109md\x1b[0m\x1b[38;2;55;177;96ml\x1b[0m\x1b[38;2;47;158;85mc\x1b[0m\x1b[38;2;39;139;74m:\x1b[0m\x1b[38;2;31;120;63m,\x1b[0m\x1b[38;2;25;104;53m'\x1b[0m\x1b[38;2;17;81;40m.\x1b[0m\x1b[38;2;10;56;25m.\x1b[0m        
+\x1b[38;2;53;143;84m:\x1b[0m\x1b[38;2;76;205;122mx\x1b[0m\x1b[38;2;60;169;98ml\x1b[0m\x1b[38;2;56;160;91mc\x1b[0m\x1b[38;2;63;180;102mo\x1b[0m\x1b[38;2;81;230;130mk\x1b[0m\x1b[38;2;88;252;142mO\x1b[0m\x1b[38;2;84;244;136mO\x1b[0m\x1b[38;2;78;231;129mk\x1b[0m\x1b[38;2;71;214;119mx\x1b[0m\x1b[38;2;40;129;69m;\x1b[0m \x1b[38;2;56;161;92ml\x1b[0m\x1b[38;2;63;193;106mo\x1b[0m\x1b[38;2;54;173;94ml\x1b[0m\x1b[38;2;45;151;81mc\x1b[0m\x1b[38;2;35;130;68m;\x1b[0m\x1b[38;2;24;100;51m'\x1b[0m\x1b[38;2;14;66;32m.\x1b[0m\x1b[38;2;9;51;23m.\x1b[0m\x1b[38;2;7;48;21m.\x1b[0m\x1b[38;2;7;52;23m.\x1b[0m\x1b[38;2;6;47;20m.\x1b[0m      
+\x1b[38;2;77;205;123mx\x1b[0m\x1b[38;2;30;91;49m'\x1b[0m   \x1b[38;2;32;99;52m'\x1b[0m\x1b[38;2;76;225;125mk\x1b[0m\x1b[38;2;70;211;117mx\x1b[0m\x1b[38;2;58;183;100mo\x1b[0m\x1b[38;2;11;48;22m.\x1b[0m \x1b[38;2;22;67;36m.\x1b[0m\x1b[38;2;70;210;117mx\x1b[0m\x1b[38;2;58;184;101mo\x1b[0m\x1b[38;2;47;156;84mc\x1b[0m\x1b[38;2;15;59;28m.\x1b[0m      \x1b[38;2;6;50;22m.\x1b[0m      
+\x1b[38;2;57;150;90mc\x1b[0m\x1b[38;2;38;113;63m,\x1b[0m    \x1b[38;2;39;114;63m,\x1b[0m\x1b[38;2;60;189;104mo\x1b[0m\x1b[38;2;39;135;71m:\x1b[0m   \x1b[38;2;67;193;111md\x1b[0m\x1b[38;2;62;193;106mo\x1b[0m\x1b[38;2;31;107;56m,\x1b[0m       \x1b[38;2;18;87;43m.\x1b[0m      
+\x1b[38;2;54;146;86mc\x1b[0m\x1b[38;2;32;98;52m'\x1b[0m    \x1b[38;2;44;126;72m;\x1b[0m\x1b[38;2;45;153;83mc\x1b[0m\x1b[38;2;13;57;26m.\x1b[0m   \x1b[38;2;28;84;45m.\x1b[0m\x1b[38;2;67;204;113md\x1b[0m\x1b[38;2;43;141;76m:\x1b[0m     \x1b[38;2;14;55;25m.\x1b[0m\x1b[38;2;36;128;69m;\x1b[0m       
+ \x1b[38;2;65;182;106mo\x1b[0m\x1b[38;2;21;69;35m.\x1b[0m  \x1b[38;2;40;117;66m;\x1b[0m\x1b[38;2;49;158;87mc\x1b[0m\x1b[38;2;14;62;30m.\x1b[0m    \x1b[38;2;31;98;52m'\x1b[0m\x1b[38;2;61;189;104mo\x1b[0m\x1b[38;2;35;118;63m;\x1b[0m  \x1b[38;2;29;88;49m'\x1b[0m \x1b[38;2;57;164;97ml\x1b[0m         
+  \x1b[38;2;34;104;56m,\x1b[0m\x1b[38;2;44;134;72m:\x1b[0m\x1b[38;2;42;131;70m;\x1b[0m\x1b[38;2;45;139;75m:\x1b[0m\x1b[38;2;48;148;80m:\x1b[0m\x1b[38;2;46;143;78m:\x1b[0m\x1b[38;2;21;79;40m.\x1b[0m     \x1b[38;2;26;89;45m'\x1b[0m\x1b[38;2;34;116;61m,\x1b[0m\x1b[38;2;29;104;54m,\x1b[0m\x1b[38;2;23;87;44m.\x1b[0m\x1b[38;2;25;91;46m'\x1b[0m\x1b[38;2;34;112;60m,\x1b[0m\x1b[38;2;23;78;41m.\x1b[0m        
 """
 
 from .compress import (
     probe_video, compress, convert_to_gif, convert_to_loop,
     VideoInfo, PRESETS, DEFAULT_PRESET, Preset,
-    detect_preset_from_filename, detect_special_format,
+    detect_preset_from_filename,
     parse_time, SPECIAL_FORMATS,
 )
 from .watcher import Watcher, WatchFolders, Job, JobStatus
-from .config import get_config, get_config_path, reload_config
-from .history import load_history, add_to_history, HistoryEntry
+from .config import CONFIG_FILE, Config, get_config, get_config_path, reload_config
+from .history import load_history, add_to_history
+
+
+# PRESETS is fixed at import, so everything derived from it is built once:
+# main-screen choices (plus special formats), config choices, and the log summary
+_PRESET_SELECT_OPTIONS = tuple(
+    (f"{p.name} - {p.description[:30]}", p.name) for p in PRESETS.values()
+) + (
+    ("gif - animated GIF", "gif"),
+    ("loop - iMessage loop", "loop"),
+)
+_PRESET_NAME_OPTIONS = tuple((name, name) for name in PRESETS)
+_PRESET_NAMES = ", ".join(PRESETS)
+
+# Placeholder bodies shown until a panel has data, parsed once at import
+_EMPTY_INPUT = Text.from_markup("[dim]No video loaded[/dim]\n\nPaste path below or drop into inbox")
+_EMPTY_OUTPUT = Text.from_markup("[dim]Waiting for compression...[/dim]")
+_EMPTY_QUEUE = Text.from_markup("[dim]Watcher not started[/dim]")
+_QUEUE_HINT = "\n[dim]No jobs in queue[/dim]\n\n[dim]Drop files with suffix:[/dim]\n  video-social.mp4\n  video-gif-5s-10s.mp4 → trim\n  video-loop-0-3.mp4 → clip"
+
+# Textual markup's named colours, for bodies assembled as Rich Text
+_GREEN = "#008000"
+_YELLOW = "#ffff00"
 
 
 class VideoInfoPanel(Static):
     """Display video metadata"""
 
     BORDER_TITLE = "[ INPUT ]"
+    # Our own plain state lives in slots; Textual's base state stays in __dict__
+    __slots__ = ("_body",)
+
+    info: reactive[VideoInfo | None] = reactive(None)
+    preset: reactive[Preset | None] = reactive(None)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._info: VideoInfo | None = None
-        self._preset: Preset | None = None
+        self._body: Text = _EMPTY_INPUT
         self.border_title = self.BORDER_TITLE
 
-    def update_info(self, info: VideoInfo | None, preset: Preset | None = None):
-        self._info = info
-        self._preset = preset
-        self.refresh()
+    def watch_info(self):
+        self._build_body()
 
-    def render(self):
-        if not self._info:
-            return "[dim]No video loaded[/dim]\n\nPaste path below or drop into inbox"
+    def watch_preset(self):
+        self._build_body()
 
-        i = self._info
-        preset_str = f"[bold]{self._preset.name}[/bold]" if self._preset else "[dim]auto[/dim]"
-        return f"""[bold]{i.path.name}[/bold]
+    def _build_body(self):
+        """Assemble the styled body once per change so render skips markup parsing"""
+        i = self.info
+        if not i:
+            self._body = _EMPTY_INPUT
+            return
 
-Dimensions  {i.dimensions}
-Duration    {i.duration:.1f}s
-Codec       {i.codec}
-FPS         {i.fps:.0f}
-Bitrate     {i.bitrate // 1000} kbps
-Size        [bold]{i.size_mb:.1f} MB[/bold]
-Preset      {preset_str}"""
+        preset_part = (self.preset.name, "bold") if self.preset else ("auto", "dim")
+        self._body = Text.assemble(
+            (i.path.name, "bold"), "\n",
+            "\n",
+            f"Dimensions  {i.dimensions}\n",
+            f"Duration    {i.duration:.1f}s\n",
+            f"Codec       {i.codec}\n",
+            f"FPS         {i.fps:.0f}\n",
+            f"Bitrate     {i.bitrate // 1000} kbps\n",
+            "Size        ", (f"{i.size_mb:.1f} MB", "bold"), "\n",
+            "Preset      ", preset_part,
+        )
+
+    def render(self):
+        return self._body
 
 
 class OutputPanel(Static):
     """Display compression results"""
 
     BORDER_TITLE = "[ OUTPUT ]"
+    __slots__ = ("_body",)
+
+    result: reactive[tuple | None] = reactive(None)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._result = None
+        self._body = _EMPTY_OUTPUT
         self.border_title = self.BORDER_TITLE
 
     def set_result(self, original_mb: float, compressed_mb: float, reduction: float, path: Path, preset_name: str = "", kept_original: bool = False):
-        self._result = (original_mb, compressed_mb, reduction, path, preset_name, kept_original)
-        self.refresh()
+        self.result = (original_mb, compressed_mb, reduction, path, preset_name, kept_original)
 
     def clear(self):
-        self._result = None
-        self.refresh()
+        self.result = None
 
-    def render(self):
-        if not self._result:
-            return "[dim]Waiting for compression...[/dim]"
+    def watch_result(self):
+        """Assemble the styled body once per result so repaints reuse it"""
+        if not self.result:
+            self._body = _EMPTY_OUTPUT
+            return
 
-        orig, comp, reduction, path, preset_name, kept_original = self._result
+        orig, comp, reduction, path, preset_name, kept_original = self.result
 
         # Handle size display
         if kept_original:
-            size_note = "[dim]kept original[/dim]"
+            size_note = (("kept original", "dim"),)
         elif abs(reduction) < 0.1:
-            size_note = "[dim]converted[/dim]"
+            size_note = (("converted", "dim"),)
         elif reduction < 0:
-            size_note = f"[yellow]+{abs(reduction):.1f}%[/yellow] [dim](kept original)[/dim]"
+            size_note = ((f"+{abs(reduction):.1f}%", _YELLOW), " ", ("(kept original)", "dim"))
         else:
-            size_note = f"[bold green]-{reduction:.1f}%[/bold green]"
+            size_note = ((f"-{reduction:.1f}%", f"bold {_GREEN}"),)
 
         # Show path with ~ shorthand for home directory
         home = str(Path.home())
@@ -168,76 +213,144 @@ class OutputPanel(Static):
         if dir_str.startswith(home):
             dir_str = "~" + dir_str[len(home):]
 
-        return f"""[bold]{path.name}[/bold]
-[dim]{dir_str}/[/dim]
+        self._body = Text.assemble(
+            (path.name, "bold"), "\n",
+            (f"{dir_str}/", "dim"), "\n",
+            "\n",
+            f"{orig:.1f} MB → ", (f"{comp:.1f} MB", "bold"), "  ", *size_note, "\n",
+            f"Format      {preset_name}",
+        )
+
+    def render(self):
+        return self._body
 
-{orig:.1f} MB → [bold]{comp:.1f} MB[/bold]  {size_note}
-Format      {preset_name}"""
+
+_STATUS_ICONS = {
+    JobStatus.QUEUED: ">",
+    JobStatus.PROCESSING: "~",
+    JobStatus.DONE: "+",
+    JobStatus.FAILED: "!",
+}
+
+
+def _job_display_name(job: Job) -> str:
+    """Truncated filename for the queue, computed once per job"""
+    name = getattr(job, "_display_name", None)
+    if name is None:
+        full = job.input_path.name
+        name = full if len(full) <= 30 else full[:27] + "..."
+        job._display_name = name
+    return name
 
 
 class QueuePanel(Static):
     """Display job queue from watcher"""
 
     BORDER_TITLE = "[ QUEUE ]"
+    MAX_VISIBLE_JOBS = 8
+    __slots__ = ("_jobs", "_last_shown", "_header", "_idle_body")
+
+    watch_path: reactive[Path | None] = reactive(None)
+    # Formatted rows for the visible jobs; a new tuple repaints, an equal one doesn't
+    lines: reactive[tuple[str, ...]] = reactive(())
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._jobs: list[Job] = []
-        self._watch_path: Path | None = None
+        # Jobs are mutated in place by the watcher, so they can't be a reactive
+        # themselves - each change re-derives `lines` from a snapshot instead.
+        # Only the visible tail is kept, keyed by id() for O(1) lookups (Job is
+        # an unhashable dataclass and its path changes as it moves through
+        # the folders); the watcher owns the full list.
+        self._jobs: OrderedDict[int, Job] = OrderedDict()
+        self._last_shown: tuple = ()
+        self._header = ""
+        self._idle_body = ""
         self.border_title = self.BORDER_TITLE
 
-    def set_watch_path(self, path: Path):
-        self._watch_path = path
-        self.refresh()
+    def watch_watch_path(self, path: Path | None):
+        """Build the folder header and idle text once per watch folder"""
+        self._header = f"[dim]Watching:[/dim] {path}/inbox\n"
+        self._idle_body = self._header + _QUEUE_HINT
+
+    def add_job(self, job: Job):
+        """Show a newly queued job; the oldest row drops off once full"""
+        self._jobs[id(job)] = job
+        if len(self._jobs) > self.MAX_VISIBLE_JOBS:
+            self._jobs.popitem(last=False)
+        self._refresh_if_changed()
+
+    def clear_jobs(self):
+        self._jobs.clear()
+        self._refresh_if_changed()
+
+    def update_job(self, job: Job):
+        """Repaint after a single job changed, if it is on screen"""
+        if id(job) in self._jobs:
+            self._refresh_if_changed()
+
+    def refresh_jobs(self):
+        """Repaint after jobs changed in place"""
+        self._refresh_if_changed()
+
+    def _refresh_if_changed(self):
+        # Progress ticks far finer than the whole percent we display; skip the
+        # repaint unless a visible row would actually look different
+        shown = tuple((job, job.status, round(job.progress * 100)) for job in self._jobs.values())
+        if shown == self._last_shown:
+            return
 
-    def update_jobs(self, jobs: list[Job]):
-        self._jobs = jobs
-        self.refresh()
+        # Re-format only the rows whose snapshot moved
+        previous = {id(entry[0]): (entry, line) for entry, line in zip(self._last_shown, self.lines)}
+        lines = []
+        for entry in shown:
+            cached = previous.get(id(entry[0]))
+            if cached and cached[0] == entry:
+                lines.append(cached[1])
+            else:
+                lines.append(self._format_job(entry[0]))
+
+        self._last_shown = shown
+        self.lines = tuple(lines)
+
+    @staticmethod
+    def _format_job(job: Job) -> str:
+        status_icon = _STATUS_ICONS[job.status]
+        name = _job_display_name(job)
+
+        # Show format/preset type with trim info
+        format_tag = f"[{job.special_format}]" if job.special_format else f"[{job.preset.name}]"
+        trim_tag = ""
+        if job.start_time is not None or job.end_time is not None:
+            s = f"{job.start_time:.0f}" if job.start_time else "0"
+            e = f"{job.end_time:.0f}" if job.end_time else "end"
+            trim_tag = f" {s}-{e}s"
+
+        if job.status == JobStatus.PROCESSING:
+            pct = f"{job.progress*100:3.0f}%"
+            return f"{status_icon} {name} {pct}"
+        elif job.status == JobStatus.DONE and job.result:
+            reduction = f"-{job.result.reduction_percent:.0f}%"
+            return f"{status_icon} {name} {reduction}"
+        else:
+            return f"{status_icon} {name} {format_tag}{trim_tag}"
 
     def render(self):
-        if not self._watch_path:
-            return "[dim]Watcher not started[/dim]"
-        elif not self._jobs:
-            return f"[dim]Watching:[/dim] {self._watch_path}/inbox\n\n[dim]No jobs in queue[/dim]\n\n[dim]Drop files with suffix:[/dim]\n  video-social.mp4\n  video-gif-5s-10s.mp4 → trim\n  video-loop-0-3.mp4 → clip"
+        if not self.watch_path:
+            return _EMPTY_QUEUE
+        elif not self.lines:
+            return self._idle_body
         else:
-            lines = [f"[dim]Watching:[/dim] {self._watch_path}/inbox\n"]
-            for job in self._jobs[-8:]:  # Show last 8 jobs
-                status_icon = {
-                    JobStatus.QUEUED: ">",
-                    JobStatus.PROCESSING: "~",
-                    JobStatus.DONE: "+",
-                    JobStatus.FAILED: "!",
-                }[job.status]
-
-                name = job.input_path.name[:30]
-                if len(job.input_path.name) > 30:
-                    name = name[:27] + "..."
-
-                # Show format/preset type with trim info
-                format_tag = f"[{job.special_format}]" if job.special_format else f"[{job.preset.name}]"
-                trim_tag = ""
-                if job.start_time is not None or job.end_time is not None:
-                    s = f"{job.start_time:.0f}" if job.start_time else "0"
-                    e = f"{job.end_time:.0f}" if job.end_time else "end"
-                    trim_tag = f" {s}-{e}s"
-
-                if job.status == JobStatus.PROCESSING:
-                    pct = f"{job.progress*100:3.0f}%"
-                    lines.append(f"{status_icon} {name} {pct}")
-                elif job.status == JobStatus.DONE and job.result:
-                    reduction = f"-{job.result.reduction_percent:.0f}%"
-                    lines.append(f"{status_icon} {name} {reduction}")
-                else:
-                    lines.append(f"{status_icon} {name} {format_tag}{trim_tag}")
-
-            return "\n".join(lines)
+            return "\n".join((self._header, *self.lines))
 
 
 class StatusLog(RichLog):
     """Styled log widget with markup enabled"""
 
+    # Long watcher sessions would otherwise grow the log without bound
+    MAX_LINES = 2000
+
     def __init__(self, **kwargs):
-        super().__init__(markup=True, **kwargs)
+        super().__init__(markup=True, max_lines=self.MAX_LINES, **kwargs)
 
 
 def _clean_path(text: str) -> str:
@@ -268,8 +381,16 @@ def mark_onboarded():
     path.touch()
 
 
+_LOGO_CELL_RE = re.compile(r'\x1b\[38;2;(\d+);(\d+);(\d+)m(.)\x1b\[0m')
+
+
+@lru_cache(maxsize=64)
 def shimmer_logo(logo: str, frame: int) -> Text:
-    """Apply a shimmer effect - a diagonal wave that sweeps across once"""
+    """Apply a shimmer effect - a diagonal wave that sweeps across once
+
+    Frames are deterministic, so each one is built once and reused by later
+    sweeps and later visits to the About screen.
+    """
     result = Text()
     lines = logo.split('\n')
 
@@ -279,11 +400,13 @@ def shimmer_logo(logo: str, frame: int) -> Text:
     for y, line in enumerate(lines):
         pos = 0
         x = 0  # Track visual character position
-        pattern = re.compile(r'\x1b\[38;2;(\d+);(\d+);(\d+)m(.)\x1b\[0m')
 
-        for match in pattern.finditer(line):
+        for match in _LOGO_CELL_RE.finditer(line):
             if match.start() > pos:
-                result.append(line[pos:match.start()])
+                # Uncoloured background cells are plain spaces between matches
+                plain = line[pos:match.start()]
+                result.append(plain)
+                x += len(plain)
 
             r, g, b = int(match.group(1)), int(match.group(2)), int(match.group(3))
             char = match.group(4)
@@ -316,93 +439,6 @@ def shimmer_logo(logo: str, frame: int) -> Text:
 class AboutScreen(Screen):
     """About/onboarding screen with logo and quick start guide"""
 
-    CSS = """
-    AboutScreen {
-        align: center middle;
-        background: $surface;
-    }
-
-    #about-container {
-        width: 80;
-        height: auto;
-        padding: 1 2;
-        background: $surface;
-    }
-
-    #top-row {
-        height: auto;
-        width: 100%;
-    }
-
-    #logo-column {
-        width: 34;
-        height: auto;
-        padding-right: 1;
-        border-right: tall $primary-darken-2;
-    }
-
-    #logo-display {
-        width: auto;
-        height: auto;
-    }
-
-    #info-column {
-        width: 1fr;
-        height: 100%;
-        padding-left: 2;
-    }
-
-    #version-text {
-        text-align: left;
-    }
-
-    #tagline {
-        color: $text-muted;
-    }
-
-    #quickstart {
-        margin-top: 1;
-    }
-
-    #info-spacer {
-        height: 1fr;
-    }
-
-    #info-footer {
-        height: auto;
-        color: $text-muted;
-    }
-
-    /* Responsive classes applied programmatically */
-    .narrow #logo-column {
-        display: none;
-    }
-
-    .narrow #info-column {
-        padding-left: 0;
-    }
-
-    .wide #about-container {
-        width: 90;
-        padding: 2 3;
-    }
-
-    .wide #logo-column {
-        width: 38;
-        padding: 1;
-    }
-
-    .extra-wide #about-container {
-        width: 110;
-        padding: 3 4;
-    }
-
-    .extra-wide #logo-column {
-        width: 42;
-        padding: 2;
-    }
-    """
-
     BINDINGS = [
         Binding("escape", "dismiss", "Close", show=False),
         Binding("enter", "dismiss", "Close", show=False),
@@ -519,86 +555,17 @@ class AboutScreen(Screen):
         self.app.pop_screen()
 
 
+class ConfigChanged(Message):
+    """Posted after the config file is saved and reloaded"""
+
+    def __init__(self, config: Config):
+        super().__init__()
+        self.config = config
+
+
 class ConfigScreen(Screen):
     """Configuration editor screen with simple/advanced modes"""
 
-    CSS = """
-    ConfigScreen {
-        align: center middle;
-    }
-
-    #config-container {
-        width: 80%;
-        height: auto;
-        max-height: 90%;
-        background: $surface;
-        border: solid $primary;
-        padding: 1 2;
-    }
-
-    #config-header {
-        height: 3;
-        margin-bottom: 1;
-    }
-
-    #config-title {
-        width: 1fr;
-        text-style: bold;
-        color: $text;
-        padding: 0 1;
-    }
-
-    #mode-toggle {
-        width: auto;
-    }
-
-    .config-row {
-        height: 3;
-        margin: 1 0;
-    }
-
-    .config-label {
-        width: 20;
-        padding: 0 1;
-    }
-
-    .config-input {
-        width: 1fr;
-    }
-
-    #simple-mode {
-        height: auto;
-    }
-
-    #advanced-mode {
-        display: none;
-        height: auto;
-    }
-
-    #advanced-mode.active {
-        display: block;
-    }
-
-    #simple-mode.hidden {
-        display: none;
-    }
-
-    #config-editor {
-        height: 20;
-        margin: 1 0;
-    }
-
-    #config-buttons {
-        height: 3;
-        margin-top: 2;
-        align: center middle;
-    }
-
-    #config-buttons Button {
-        margin: 0 2;
-    }
-    """
-
     BINDINGS = [
         Binding("escape", "cancel", "Cancel"),
         Binding("ctrl+s", "save", "Save"),
@@ -610,9 +577,13 @@ class ConfigScreen(Screen):
         self.advanced_mode = False
 
     def compose(self) -> ComposeResult:
-        config = get_config()
-        config_path = get_config_path()
-        raw_content = config_path.read_text() if config_path.exists() else ""
+        # TextArea pulls in the tree-sitter highlighting stack; only load it
+        # once the config screen is actually opened
+        from textual.widgets import TextArea
+
+        # The app holds the session config and the path is a constant, so
+        # opening the screen doesn't touch the disk; save creates the file
+        config = self.app._config
 
         with Container(id="config-container"):
             with Horizontal(id="config-header"):
@@ -632,7 +603,7 @@ class ConfigScreen(Screen):
                 with Horizontal(classes="config-row"):
                     yield Static("Default Preset:", classes="config-label")
                     yield Select(
-                        [(name, name) for name in PRESETS.keys()],
+                        _PRESET_NAME_OPTIONS,
                         value=config.presets.default,
                         id="default-preset-select",
                         classes="config-input",
@@ -652,13 +623,26 @@ class ConfigScreen(Screen):
 
             # Advanced mode - raw TOML editor
             with Container(id="advanced-mode"):
-                yield Static(f"[dim]{config_path}[/dim]", id="config-path")
-                yield TextArea(raw_content, language="toml", id="config-editor", show_line_numbers=True)
+                yield Static(f"[dim]{CONFIG_FILE}[/dim]", id="config-path")
+                # Filled from the form when switching to advanced mode
+                yield TextArea("", language="toml", id="config-editor", show_line_numbers=True)
 
             with Horizontal(id="config-buttons"):
                 yield Button("Save", id="save-btn", variant="success")
                 yield Button("Cancel", id="cancel-btn", variant="default")
 
+    def on_mount(self):
+        """Cache widget references used by save and mode toggle"""
+        self._watch_input = self.query_one("#watch-base-input", Input)
+        self._preset_select = self.query_one("#default-preset-select", Select)
+        self._auto_start_switch = self.query_one("#auto-start-switch", Switch)
+        self._delete_source_switch = self.query_one("#delete-source-switch", Switch)
+        self._notifications_switch = self.query_one("#notifications-switch", Switch)
+        self._editor = self.query_one("#config-editor")
+        self._toggle_btn = self.query_one("#mode-toggle", Button)
+        self._simple_container = self.query_one("#simple-mode")
+        self._advanced_container = self.query_one("#advanced-mode")
+
     def on_button_pressed(self, event: Button.Pressed):
         if event.button.id == "save-btn":
             self.action_save()
@@ -671,9 +655,9 @@ class ConfigScreen(Screen):
         """Toggle between simple and advanced mode"""
         self.advanced_mode = not self.advanced_mode
 
-        simple = self.query_one("#simple-mode")
-        advanced = self.query_one("#advanced-mode")
-        toggle_btn = self.query_one("#mode-toggle", Button)
+        simple = self._simple_container
+        advanced = self._advanced_container
+        toggle_btn = self._toggle_btn
 
         if self.advanced_mode:
             simple.add_class("hidden")
@@ -686,18 +670,22 @@ class ConfigScreen(Screen):
             advanced.remove_class("active")
             toggle_btn.label = "Advanced"
 
-    def _sync_form_to_editor(self):
-        """Update raw editor with current form values"""
-        watch_base = self.query_one("#watch-base-input", Input).value
-        default_preset = self.query_one("#default-preset-select", Select).value
-        auto_start = self.query_one("#auto-start-switch", Switch).value
-        delete_source = self.query_one("#delete-source-switch", Switch).value
-        notifications = self.query_one("#notifications-switch", Switch).value
+    def _form_to_toml(self) -> str:
+        """Render the form's values as a config file"""
+        watch_base = self._watch_input.value
+        default_preset = self._preset_select.value
+        auto_start = self._auto_start_switch.value
+        delete_source = self._delete_source_switch.value
+        notifications = self._notifications_switch.value
+        # Settings without a form field are carried over from the session config
+        folders = self.app._config.folders
 
-        content = f'''# clipper configuration
+        return f'''# clipper configuration
 
 [folders]
 watch_base = "{watch_base}"
+poll_interval = {folders.poll_interval:g}
+max_workers = {folders.max_workers}
 
 [presets]
 default = "{default_preset}"
@@ -707,43 +695,39 @@ auto_start_watcher = {str(auto_start).lower()}
 delete_source = {str(delete_source).lower()}
 notifications = {str(notifications).lower()}
 '''
-        editor = self.query_one("#config-editor", TextArea)
-        editor.load_text(content)
+
+    def _sync_form_to_editor(self):
+        """Update raw editor with current form values"""
+        content = self._form_to_toml()
+        # Reloading re-highlights the whole document; skip it if nothing changed
+        if content != self._editor.text:
+            self._editor.load_text(content)
 
     def action_save(self):
         """Save config and return to main screen"""
         if self.advanced_mode:
             # Save raw TOML from editor
-            editor = self.query_one("#config-editor", TextArea)
-            config_content = editor.text
+            config_content = self._editor.text
         else:
-            # Build TOML from form
-            watch_base = self.query_one("#watch-base-input", Input).value
-            default_preset = self.query_one("#default-preset-select", Select).value
-            auto_start = self.query_one("#auto-start-switch", Switch).value
-            delete_source = self.query_one("#delete-source-switch", Switch).value
-            notifications = self.query_one("#notifications-switch", Switch).value
-
-            config_content = f'''# clipper configuration
-
-[folders]
-watch_base = "{watch_base}"
-
-[presets]
-default = "{default_preset}"
-
-[behavior]
-auto_start_watcher = {str(auto_start).lower()}
-delete_source = {str(delete_source).lower()}
-notifications = {str(notifications).lower()}
-'''
-
-        # Write to file
-        config_path = get_config_path()
-        config_path.write_text(config_content)
+            config_content = self._form_to_toml()
+
+        # Write to a sibling temp file and swap it in, so a concurrent
+        # reader (e.g. the watcher) never sees a truncated config. Resolve
+        # first so a symlinked config (e.g. from dotfiles) updates its target
+        # and keeps that file's permissions
+        target = get_config_path().resolve()
+        tmp_path = target.with_suffix(target.suffix + ".tmp")
+        try:
+            tmp_path.write_text(config_content)
+            if target.exists():
+                shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
-        # Reload config
-        reload_config()
+        # Reload config and let the app pick it up in place
+        self.app.post_message(ConfigChanged(reload_config()))
 
         self.app.pop_screen()
         self.app.notify("Config saved!", severity="information")
@@ -761,66 +745,6 @@ class HistoryScreen(Screen):
         Binding("q", "close", "Close"),
     ]
 
-    CSS = """
-    HistoryScreen {
-        align: center middle;
-    }
-
-    #history-container {
-        width: 90%;
-        height: 80%;
-        background: $surface;
-        border: solid $primary;
-        padding: 1 2;
-    }
-
-    #history-title {
-        text-align: center;
-        text-style: bold;
-        padding-bottom: 1;
-    }
-
-    #history-list {
-        height: 1fr;
-    }
-
-    .history-item {
-        height: 3;
-        padding: 0 1;
-        margin-bottom: 1;
-        background: $surface-darken-1;
-    }
-
-    .history-item:hover {
-        background: $primary-darken-1;
-    }
-
-    .history-item:focus {
-        background: $primary;
-    }
-
-    .history-filename {
-        width: 1fr;
-    }
-
-    .history-meta {
-        width: auto;
-        color: $text-muted;
-    }
-
-    #history-hint {
-        text-align: center;
-        color: $text-muted;
-        padding-top: 1;
-    }
-
-    #history-empty {
-        text-align: center;
-        color: $text-muted;
-        padding: 2;
-    }
-    """
-
     def compose(self) -> ComposeResult:
         history = load_history()
 
@@ -870,141 +794,9 @@ class HistoryScreen(Screen):
 class VidToolsApp(App):
     """Video compression TUI"""
 
-    CSS = """
-    Screen {
-        background: $surface;
-    }
-
-    #main-container {
-        height: 100%;
-        padding: 1;
-    }
-
-    #top-panels {
-        height: auto;
-        max-height: 14;
-    }
-
-    VideoInfoPanel, OutputPanel {
-        width: 1fr;
-        height: auto;
-        min-height: 12;
-        margin: 0 1;
-        padding: 1;
-    }
-
-    VideoInfoPanel {
-        border: solid $primary;
-        border-title-color: $primary;
-    }
-
-    OutputPanel {
-        border: solid $secondary;
-        border-title-color: $secondary;
-    }
-
-    #queue-row {
-        height: auto;
-        max-height: 14;
-        margin: 0 1;
-    }
-
-    QueuePanel {
-        width: 100%;
-        height: auto;
-        min-height: 10;
-        padding: 1;
-        border: solid $accent;
-        border-title-color: $accent;
-    }
-
-    #input-row {
-        height: 3;
-        margin: 1;
-        padding: 0 1;
-    }
-
-    #file-input {
-        width: 2fr;
-    }
-
-    #preset-select {
-        width: 1fr;
-    }
-
-    #trim-row {
-        height: 0;
-        margin: 0 1;
-        padding: 0 1;
-        overflow: hidden;
-        align-vertical: middle;
-    }
-
-    #trim-row.active {
-        height: 3;
-    }
-
-    #trim-row Label {
-        width: auto;
-        height: 3;
-        padding: 0 1;
-        content-align: center middle;
-    }
-
-    .trim-input {
-        width: 14;
-        height: 3;
-    }
-
-    #trim-spacer {
-        width: 1fr;
-    }
-
-    #progress-container {
-        height: 3;
-        margin: 1;
-        padding: 0 1;
-        display: none;
-    }
-
-    #progress-container.active {
-        display: block;
-    }
-
-    ProgressBar {
-        width: 100%;
-    }
-
-    #button-row {
-        height: 3;
-        margin: 1;
-        padding: 0 1;
-        align: center middle;
-    }
-
-    Button {
-        margin: 0 1;
-    }
-
-    #compress-btn {
-        background: $success;
-    }
-
-    #watch-btn {
-        background: $warning;
-    }
-
-    #log-container {
-        height: 1fr;
-        margin: 1;
-        border: solid $primary;
-    }
-
-    StatusLog {
-        height: 100%;
-        background: $surface-darken-1;
-    }
-    """
+    # Styles for every screen live in one stylesheet, parsed once at startup
+    # rather than each time a screen is pushed
+    CSS_PATH = "tui.tcss"
 
     BINDINGS = [
         Binding("escape", "unfocus", "Unfocus", show=False),
@@ -1029,20 +821,31 @@ class VidToolsApp(App):
         self.selected_format: str | None = None  # "gif" or "loop" for special formats
         self.watcher: Watcher | None = None
         self.watch_folders: WatchFolders | None = None
-        self._last_escape: float = 0
+        # Fixed between saves; replaced when ConfigScreen posts ConfigChanged
+        self._config = get_config()
+        self._last_escape: float = 0.0
         self._last_output: Path | None = None
-        self._log_history: list[str] = []
+        self._log_history: deque[str] = deque(maxlen=StatusLog.MAX_LINES)
         self._auto_compress_after_load: bool = False
         self._theme_index: int = 0
+        # Latest ffmpeg progress (0-1), written by the worker, drained by a timer
+        self._latest_progress: float | None = None
+        # One long-lived worker runs compressions back to back; ffmpeg already
+        # uses every core, so running two at once only thrashes
+        self._compress_queue: queue.Queue[Callable[[], None] | None] = queue.Queue()
+        self._compress_worker: threading.Thread | None = None
+        # True from submit until finish/error; Compress stays disabled meanwhile
+        self._compressing = False
+        # Pending debounce timer for queue repaints from watcher callbacks
+        self._queue_timer = None
         # Register custom themes
         for theme in THEMES:
             self.register_theme(theme)
 
-    def write_log(self, message: str):
-        """Write to log panel and keep history"""
-        self._log_history.append(message)
-        log_widget = self.query_one("#log", StatusLog)
-        log_widget.write(message)
+    def write_log(self, *messages: str):
+        """Write lines to the log panel in a single write and keep history"""
+        self._log_history.extend(messages)
+        self._status_log.write("\n".join(messages))
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -1056,12 +859,8 @@ class VidToolsApp(App):
 
             with Horizontal(id="input-row"):
                 yield Input(placeholder="Enter video path...", id="file-input")
-                # Presets plus special formats (gif, loop)
-                preset_options = [(f"{p.name} - {p.description[:30]}", p.name) for p in PRESETS.values()]
-                preset_options.append(("gif - animated GIF", "gif"))
-                preset_options.append(("loop - iMessage loop", "loop"))
                 yield Select(
-                    preset_options,
+                    _PRESET_SELECT_OPTIONS,
                     value="social",
                     id="preset-select",
                 )
@@ -1090,6 +889,26 @@ class VidToolsApp(App):
         yield Footer()
 
     def on_mount(self):
+        # Look widgets up once; handlers and progress ticks reuse these
+        self._status_log = self.query_one("#log", StatusLog)
+        self._progress = self.query_one("#progress", ProgressBar)
+        self._progress_container = self.query_one("#progress-container")
+        self._compress_btn = self.query_one("#compress-btn", Button)
+        self._share_btn = self.query_one("#share-btn", Button)
+        self._info_panel = self.query_one("#info-panel", VideoInfoPanel)
+        self._output_panel = self.query_one("#output-panel", OutputPanel)
+        self._queue_panel = self.query_one("#queue-panel", QueuePanel)
+        self._watch_btn = self.query_one("#watch-btn", Button)
+        self._file_input = self.query_one("#file-input", Input)
+        self._preset_select = self.query_one("#preset-select", Select)
+        self._load_btn = self.query_one("#load-btn", Button)
+        self._trim_row = self.query_one("#trim-row")
+        self._start_input = self.query_one("#start-input", Input)
+        self._end_input = self.query_one("#end-input", Input)
+        # Only ticks while a compression is running; 50ms keeps the bar smooth
+        # while folding bursts of ffmpeg ticks into one repaint
+        self._progress_timer = self.set_interval(0.05, self._pump_progress, pause=True)
+
         self.title = "clipper"
         self.sub_title = "video compression utility"
         self.theme = "clipper"
@@ -1100,11 +919,45 @@ class VidToolsApp(App):
         if not has_been_onboarded():
             self.call_later(self.push_screen, AboutScreen(is_onboarding=True))
 
-        config = get_config()
-        self.write_log("[bold cyan]clipper[/bold cyan] v0.1.0")
-        self.write_log(f"[dim]Config: {get_config_path()}[/dim]")
-        self.write_log(f"[dim]Watch folder: {config.folders.watch_base}[/dim]")
-        self.write_log(f"[dim]Presets: {', '.join(PRESETS.keys())} | Press [bold]e[/bold] to edit config[/dim]")
+        config = self._config
+        self.write_log(
+            "[bold cyan]clipper[/bold cyan] v0.1.0",
+            f"[dim]Config: {get_config_path()}[/dim]",
+            f"[dim]Watch folder: {config.folders.watch_base}[/dim]",
+            f"[dim]Presets: {_PRESET_NAMES} | Press [bold]e[/bold] to edit config[/dim]",
+        )
+
+    def _schedule_queue_refresh(self):
+        """Repaint the queue within 50ms, folding in any other changes until then"""
+        if self._queue_timer is None:
+            self._queue_timer = self.set_timer(0.05, self._flush_queue)
+
+    def _flush_queue(self):
+        # Clear first so a change landing mid-flush schedules another pass
+        self._queue_timer = None
+        self._queue_panel.refresh_jobs()
+
+    def _pump_progress(self):
+        """Show the most recent progress value, dropping any in between"""
+        p = self._latest_progress
+        if p is None:
+            return
+        self._latest_progress = None
+        # The bar shows whole percents; finer moves aren't worth a repaint
+        pct = round(p * 100)
+        if pct != self._progress.progress:
+            self._progress.update(progress=pct)
+
+    def on_config_changed(self, message: ConfigChanged):
+        """Adopt a saved config without rebuilding any widgets"""
+        old, self._config = self._config, message.config
+        lines = ["[dim]Config reloaded[/dim]"]
+        watch_base = self._config.folders.watch_base
+        if watch_base != old.folders.watch_base:
+            lines.append(f"[dim]Watch folder: {watch_base}[/dim]")
+            if self.watcher and self.watcher.is_running:
+                lines.append("[dim]Restart the watcher (w) to switch folders[/dim]")
+        self.write_log(*lines)
 
     def on_button_pressed(self, event: Button.Pressed):
         if event.button.id == "load-btn":
@@ -1135,8 +988,10 @@ class VidToolsApp(App):
 
         # Handle http/https URLs (e.g. Giphy links)
         if text.startswith(("http://", "https://")):
-            file_input = self.query_one("#file-input", Input)
-            file_input.value = text
+            if self._reject_load_while_busy():
+                event.prevent_default()
+                return
+            self._file_input.value = text
             # Auto-detect GIF URLs and set format + auto-run
             is_gif_url = (
                 text.lower().endswith(".gif")
@@ -1145,10 +1000,8 @@ class VidToolsApp(App):
             )
             if is_gif_url:
                 self.selected_format = "gif"
-                select = self.query_one("#preset-select", Select)
-                select.value = "gif"
-                trim_row = self.query_one("#trim-row")
-                trim_row.add_class("active")
+                self._preset_select.value = "gif"
+                self._trim_row.add_class("active")
                 self._auto_compress_after_load = True
             self.action_load_video()
             event.prevent_default()
@@ -1162,17 +1015,28 @@ class VidToolsApp(App):
         path = Path(text)
 
         if path.suffix.lower() in video_extensions and path.exists():
+            if self._reject_load_while_busy():
+                event.prevent_default()
+                return
             # Put path in input and load it
-            file_input = self.query_one("#file-input", Input)
-            file_input.value = str(path)
+            self._file_input.value = str(path)
             self.action_load_video()
             event.prevent_default()
         # Otherwise let normal paste behavior happen
 
+    def _reject_load_while_busy(self) -> bool:
+        """Refuse a new load while a probe or download is in flight"""
+        # Checked before touching the input or format, so a dropped load
+        # can't leave gif/auto-compress settings for the earlier file
+        if not self._load_btn.disabled:
+            return False
+        self.notify("Still loading - try again in a moment", severity="warning")
+        return True
+
     def on_select_changed(self, event: Select.Changed):
         if event.select.id == "preset-select":
             value = event.value
-            trim_row = self.query_one("#trim-row")
+            trim_row = self._trim_row
 
             if value in SPECIAL_FORMATS:
                 # Special format selected (gif or loop)
@@ -1188,13 +1052,12 @@ class VidToolsApp(App):
                 trim_row.remove_class("active")
 
             if self.video_info:
-                info_panel = self.query_one("#info-panel", VideoInfoPanel)
-                info_panel.update_info(self.video_info, self.selected_preset if not self.selected_format else None)
+                self._info_panel.info = self.video_info
+                self._info_panel.preset = self.selected_preset if not self.selected_format else None
 
     def action_go(self):
         """Smart Go button: load if no file loaded, compress if file is ready."""
-        file_input = self.query_one("#file-input", Input)
-        path_str = _clean_path(file_input.value.strip())
+        path_str = _clean_path(self._file_input.value.strip())
 
         if not path_str:
             return
@@ -1211,10 +1074,9 @@ class VidToolsApp(App):
         """Download a URL (e.g. Giphy link) and load the resulting file."""
         import tempfile
         import urllib.request
-        import re as _re
 
         self.write_log(f"[cyan]Downloading:[/cyan] {url}")
-        load_btn = self.query_one("#load-btn", Button)
+        load_btn = self._load_btn
         load_btn.disabled = True
         load_btn.label = "Downloading..."
 
@@ -1257,8 +1119,7 @@ class VidToolsApp(App):
                 def finish():
                     load_btn.disabled = False
                     load_btn.label = "Go"
-                    file_input = self.query_one("#file-input", Input)
-                    file_input.value = str(dest)
+                    self._file_input.value = str(dest)
                     self.write_log(f"[green]Downloaded:[/green] {dest.name} ({dest.stat().st_size / (1024*1024):.1f} MB)")
                     self.action_load_video()
 
@@ -1275,8 +1136,11 @@ class VidToolsApp(App):
         thread.start()
 
     def action_load_video(self):
-        file_input = self.query_one("#file-input", Input)
-        path_str = _clean_path(file_input.value.strip())
+        # Go stays disabled while a probe or download is in flight
+        if self._load_btn.disabled:
+            return
+
+        path_str = _clean_path(self._file_input.value.strip())
 
         if not path_str:
             return
@@ -1286,82 +1150,86 @@ class VidToolsApp(App):
             self._download_and_load(path_str)
             return
 
-        path = Path(path_str).expanduser().resolve()
+        path = Path(path_str).expanduser()
 
         if not path.exists():
             self.write_log(f"[red]Error:[/red] File not found: {path}")
             return
 
+        # Only resolve symlinks once we know there's a file to load
+        path = path.resolve()
+
         self.write_log(f"[cyan]Probing:[/cyan] {path.name}...")
-        load_btn = self.query_one("#load-btn", Button)
+        load_btn = self._load_btn
         load_btn.disabled = True
         load_btn.label = "Loading..."
 
         def do_probe():
             try:
                 info = probe_video(path)
-
-                def finish():
-                    self.video_info = info
-
-                    # Auto-detect preset from filename
-                    detected = detect_preset_from_filename(path)
-                    if detected:
-                        self.selected_preset = detected
-                        select = self.query_one("#preset-select", Select)
-                        select.value = detected.name
-                        self.write_log(f"[magenta]Preset detected:[/magenta] {detected.name}")
-
-                    info_panel = self.query_one("#info-panel", VideoInfoPanel)
-                    info_panel.update_info(self.video_info, self.selected_preset)
-
-                    output_panel = self.query_one("#output-panel", OutputPanel)
-                    output_panel.clear()
-
-                    compress_btn = self.query_one("#compress-btn", Button)
-                    compress_btn.disabled = False
-
-                    self.write_log(f"[green]Loaded:[/green] {info.dimensions}, {info.size_mb:.1f} MB")
-                    load_btn.disabled = False
-                    load_btn.label = "Go ▶"
-
-                    # Auto-compress if triggered by GIF URL paste
-                    if self._auto_compress_after_load:
-                        self._auto_compress_after_load = False
-                        self.action_compress()
-
-                self.call_from_thread(finish)
-
+                # Auto-detect preset from filename
+                detected = detect_preset_from_filename(path)
             except Exception as e:
                 def on_error():
                     self.write_log(f"[red]Error:[/red] {e}")
                     load_btn.disabled = False
                     load_btn.label = "Go"
                 self.call_from_thread(on_error)
+                return
+
+            self.call_from_thread(self._apply_probe_result, info, detected)
 
         thread = threading.Thread(target=do_probe, daemon=True)
         thread.start()
 
+    def _apply_probe_result(self, info: VideoInfo, detected: Preset | None):
+        """Show a freshly probed video and make it ready to compress"""
+        self.video_info = info
+
+        if detected:
+            self.selected_preset = detected
+            self._preset_select.value = detected.name
+            self.write_log(f"[magenta]Preset detected:[/magenta] {detected.name}")
+
+        self._info_panel.info = self.video_info
+        self._info_panel.preset = self.selected_preset
+
+        self._output_panel.clear()
+
+        self._compress_btn.disabled = self._compressing
+
+        self.write_log(f"[green]Loaded:[/green] {info.dimensions}, {info.size_mb:.1f} MB")
+        self._load_btn.disabled = False
+        self._load_btn.label = "Go ▶"
+
+        # Auto-compress if triggered by GIF URL paste
+        if self._auto_compress_after_load:
+            self._auto_compress_after_load = False
+            self.action_compress()
+
     def action_compress(self):
-        if not self.video_info:
+        # One compression at a time: the progress bar and Compress button
+        # belong to the running job until it finishes
+        if not self.video_info or self._compressing:
             return
 
-        progress_container = self.query_one("#progress-container")
-        progress = self.query_one("#progress", ProgressBar)
-        compress_btn = self.query_one("#compress-btn", Button)
+        progress_container = self._progress_container
+        progress = self._progress
+        compress_btn = self._compress_btn
 
         compress_btn.disabled = True
         progress_container.add_class("active")
         progress.update(total=100, progress=0)
 
+        # Queued work may run after another file is loaded - capture
+        # everything the job needs now rather than reading self later
+        input_path = self.video_info.path
         preset = self.selected_preset
         special_format = self.selected_format
 
         # Get trim values if set
-        start_input = self.query_one("#start-input", Input)
-        end_input = self.query_one("#end-input", Input)
-        start_time = parse_time(start_input.value)
-        end_time = parse_time(end_input.value)
+        start_time = parse_time(self._start_input.value)
+        end_time = parse_time(self._end_input.value)
 
         # Build trim info string
         trim_info = ""
@@ -1378,48 +1246,54 @@ class VidToolsApp(App):
             has_trim = start_time is not None or end_time is not None
             if is_already_gif and is_small and not has_trim:
                 # Pass through — just copy to output dir
-                import shutil
-                from clipper.compress import _resolve_output_dir, CompressionResult, Preset
+                from clipper.compress import _resolve_output_dir
                 dest_dir = _resolve_output_dir(self.video_info.path)
                 dest = dest_dir / self.video_info.path.name
                 if dest.resolve() != self.video_info.path.resolve():
                     shutil.copy2(self.video_info.path, dest)
-                self.write_log(f"[green]Already a GIF:[/green] {self.video_info.path.name} ({self.video_info.size_mb:.1f} MB)")
-                self.write_log(f"[dim]  Under 1 MB — copied as-is[/dim]")
+                self.write_log(
+                    f"[green]Already a GIF:[/green] {self.video_info.path.name} ({self.video_info.size_mb:.1f} MB)",
+                    f"[dim]  Under 1 MB — copied as-is[/dim]",
+                )
                 progress_container.remove_class("active")
                 compress_btn.disabled = False
                 # Show result
-                output_panel = self.query_one("#output-panel", OutputPanel)
                 sz = dest.stat().st_size
-                output_panel.set_result(
+                self._output_panel.set_result(
                     sz / (1024 * 1024), sz / (1024 * 1024), 0.0, dest, "gif"
                 )
                 self._last_output = dest
-                self.query_one("#share-btn", Button).disabled = False
+                self._share_btn.disabled = False
                 return
 
             # Show output filename
             stem = self.video_info.path.stem
             out_stem = re.sub(r'-gif(-\d+s?(-\d+s?)?)?$', '', stem, flags=re.IGNORECASE)
-            self.write_log(f"[yellow]Converting to GIF:[/yellow] {self.video_info.path.name}{trim_info}")
             out_width = min(480, self.video_info.width)
-            self.write_log(f"[dim]  → {out_stem}.gif · {out_width}px wide, 15fps, 128 colors[/dim]")
+            self.write_log(
+                f"[yellow]Converting to GIF:[/yellow] {self.video_info.path.name}{trim_info}",
+                f"[dim]  → {out_stem}.gif · {out_width}px wide, 15fps, 128 colors[/dim]",
+            )
         elif special_format == "loop":
-            self.write_log(f"[yellow]Creating loop:[/yellow] {self.video_info.path.name}{trim_info}")
-            self.write_log(f"[dim]  50% scale, silent, iMessage-optimized[/dim]")
+            self.write_log(
+                f"[yellow]Creating loop:[/yellow] {self.video_info.path.name}{trim_info}",
+                f"[dim]  50% scale, silent, iMessage-optimized[/dim]",
+            )
         else:
-            self.write_log(f"[yellow]Compressing:[/yellow] {self.video_info.path.name}")
-            self.write_log(f"[dim]  Preset: {preset.name} | Scale: {preset.scale*100:.0f}% | CRF: {preset.crf}[/dim]")
+            self.write_log(
+                f"[yellow]Compressing:[/yellow] {self.video_info.path.name}",
+                f"[dim]  Preset: {preset.name} | Scale: {preset.scale*100:.0f}% | CRF: {preset.crf}[/dim]",
+            )
 
         def on_progress(p: float):
-            self.call_from_thread(progress.update, progress=p * 100)
+            self._latest_progress = p
 
         def do_compress():
             try:
                 # Choose the right conversion function
                 if special_format == "gif":
                     result = convert_to_gif(
-                        self.video_info.path,
+                        input_path,
                         start=start_time,
                         end=end_time,
                         on_progress=on_progress,
@@ -1427,7 +1301,7 @@ class VidToolsApp(App):
                     format_name = "gif"
                 elif special_format == "loop":
                     result = convert_to_loop(
-                        self.video_info.path,
+                        input_path,
                         start=start_time,
                         end=end_time,
                         on_progress=on_progress,
@@ -1435,7 +1309,7 @@ class VidToolsApp(App):
                     format_name = "loop"
                 else:
                     result = compress(
-                        self.video_info.path,
+                        input_path,
                         preset=preset,
                         on_progress=on_progress,
                     )
@@ -1452,10 +1326,12 @@ class VidToolsApp(App):
                 )
 
                 def finish():
+                    self._compressing = False
+                    self._progress_timer.pause()
+                    self._latest_progress = None
                     progress.update(progress=100)
                     progress_container.remove_class("active")
-                    output_panel = self.query_one("#output-panel", OutputPanel)
-                    output_panel.set_result(
+                    self._output_panel.set_result(
                         result.original_size / (1024 * 1024),
                         result.compressed_size / (1024 * 1024),
                         result.reduction_percent,
@@ -1463,33 +1339,54 @@ class VidToolsApp(App):
                         format_name,
                         kept_original=result.kept_original,
                     )
-                    self.write_log(f"[green]Done![/green] {result.output_path}")
+                    lines = [f"[green]Done![/green] {result.output_path}"]
                     if result.kept_original:
-                        self.write_log(f"[dim]Kept original — compressed was larger[/dim]")
+                        lines.append(f"[dim]Kept original — compressed was larger[/dim]")
                     elif result.reduction_percent >= 0:
-                        self.write_log(f"[green]Reduced:[/green] {result.reduction_percent:.1f}%")
+                        lines.append(f"[green]Reduced:[/green] {result.reduction_percent:.1f}%")
+                    self.write_log(*lines)
                     compress_btn.disabled = False
                     # Enable share button
                     self._last_output = result.output_path
-                    share_btn = self.query_one("#share-btn", Button)
-                    share_btn.disabled = False
+                    self._share_btn.disabled = False
 
                 self.call_from_thread(finish)
 
             except Exception as e:
                 def error():
+                    self._compressing = False
+                    self._progress_timer.pause()
+                    self._latest_progress = None
                     progress_container.remove_class("active")
                     self.write_log(f"[red]Error:[/red] {e}")
                     compress_btn.disabled = False
 
                 self.call_from_thread(error)
 
-        thread = threading.Thread(target=do_compress, daemon=True)
-        thread.start()
+        self._compressing = True
+        self._latest_progress = None
+        self._progress_timer.resume()
+        self._submit_compress(do_compress)
+
+    def _submit_compress(self, task: Callable[[], None]):
+        """Queue work for the shared compression thread, starting it on first use"""
+        if self._compress_worker is None:
+            self._compress_worker = threading.Thread(
+                target=self._run_compressions, name="clipper-compress", daemon=True
+            )
+            self._compress_worker.start()
+        self._compress_queue.put(task)
+
+    def _run_compressions(self):
+        while True:
+            task = self._compress_queue.get()
+            if task is None:
+                return
+            task()
 
     def action_toggle_watch(self):
-        watch_btn = self.query_one("#watch-btn", Button)
-        queue_panel = self.query_one("#queue-panel", QueuePanel)
+        watch_btn = self._watch_btn
+        queue_panel = self._queue_panel
 
         if self.watcher and self.watcher.is_running:
             # Stop watcher
@@ -1498,29 +1395,34 @@ class VidToolsApp(App):
             self.write_log("[yellow]Watcher stopped[/yellow]")
         else:
             # Start watcher
-            config = get_config()
+            config = self._config
             watch_base = config.folders.watch_base
             self.watch_folders = WatchFolders.create(watch_base)
-            queue_panel.set_watch_path(watch_base)
+            queue_panel.watch_path = watch_base
+            queue_panel.clear_jobs()
 
+            # Each update touches the queue and the log; batch_update folds
+            # both into one screen refresh
             def on_job_added(job: Job):
                 def update():
-                    queue_panel.update_jobs(self.watcher.jobs)
-                    self.write_log(f"[cyan]Queued:[/cyan] {job.input_path.name} [{job.preset.name}]")
+                    with self.batch_update():
+                        queue_panel.add_job(job)
+                        self.write_log(f"[cyan]Queued:[/cyan] {job.input_path.name} [{job.preset.name}]")
                 self.call_from_thread(update)
 
             def on_job_updated(job: Job):
-                def update():
-                    queue_panel.update_jobs(self.watcher.jobs)
-                self.call_from_thread(update)
+                # Progress ticks only hop to the UI thread when nothing is pending
+                if self._queue_timer is None:
+                    self.call_from_thread(self._schedule_queue_refresh)
 
             def on_job_done(job: Job):
                 def update():
-                    queue_panel.update_jobs(self.watcher.jobs)
-                    if job.status == JobStatus.DONE and job.result:
-                        self.write_log(f"[green]Completed:[/green] {job.result.output_path.name} (-{job.result.reduction_percent:.1f}%)")
-                    elif job.status == JobStatus.FAILED:
-                        self.write_log(f"[red]Failed:[/red] {job.input_path.name} - {job.error}")
+                    with self.batch_update():
+                        queue_panel.update_job(job)
+                        if job.status == JobStatus.DONE and job.result:
+                            self.write_log(f"[green]Completed:[/green] {job.result.output_path.name} (-{job.result.reduction_percent:.1f}%)")
+                        elif job.status == JobStatus.FAILED:
+                            self.write_log(f"[red]Failed:[/red] {job.input_path.name} - {job.error}")
                 self.call_from_thread(update)
 
             self.watcher = Watcher(
@@ -1528,19 +1430,21 @@ class VidToolsApp(App):
                 on_job_added=on_job_added,
                 on_job_updated=on_job_updated,
                 on_job_done=on_job_done,
-                delete_source=get_config().behavior.delete_source,
+                delete_source=config.behavior.delete_source,
+                max_workers=config.folders.max_workers,
             )
             self.watcher.start()
 
             watch_btn.label = "Stop Watcher"
-            self.write_log(f"[green]Watcher started[/green]")
-            self.write_log(f"[dim]Inbox: {self.watch_folders.inbox}[/dim]")
-            self.write_log(f"[dim]Output: {self.watch_folders.done}[/dim]")
+            self.write_log(
+                f"[green]Watcher started[/green]",
+                f"[dim]Inbox: {self.watch_folders.inbox}[/dim]",
+                f"[dim]Output: {self.watch_folders.done}[/dim]",
+            )
 
     def action_unfocus(self):
         """Return to command mode, double-tap to quit"""
-        import time
-        now = time.time()
+        now = time.monotonic()
 
         # If already unfocused and escape pressed twice within 0.5s, quit
         if self.focused is None and (now - self._last_escape) < 0.5:
@@ -1557,21 +1461,36 @@ class VidToolsApp(App):
             return
 
         import subprocess
-        path_str = str(self._last_output)
+        output = self._last_output
+        path_str = str(output)
+
+        # open/pbcopy can stall briefly on a busy pasteboard - keep them off
+        # the UI thread
+        def do_share():
+            try:
+                # Reveal in Finder
+                subprocess.run(["open", "-R", path_str], check=True)
 
-        # Reveal in Finder
-        subprocess.run(["open", "-R", path_str], check=True)
+                # Also copy path to clipboard
+                subprocess.run(["pbcopy"], input=path_str.encode(), check=True)
+            except Exception as e:
+                def on_error():
+                    self.write_log(f"[red]Reveal failed:[/red] {e}")
+                self.call_from_thread(on_error)
+                return
 
-        # Also copy path to clipboard
-        subprocess.run(["pbcopy"], input=path_str.encode(), check=True)
+            def finish():
+                self.write_log(f"[cyan]Revealed:[/cyan] {output.name}")
+                self.notify("Opened in Finder (path copied)", severity="information")
 
-        self.write_log(f"[cyan]Revealed:[/cyan] {self._last_output.name}")
-        self.notify("Opened in Finder (path copied)", severity="information")
+            self.call_from_thread(finish)
+
+        thread = threading.Thread(target=do_share, daemon=True)
+        thread.start()
 
     def action_copy_log(self):
         """Copy log contents to clipboard"""
         import subprocess
-        import re
 
         if not self._log_history:
             self.notify("No logs to copy", severity="warning")
@@ -1590,40 +1509,32 @@ class VidToolsApp(App):
 
     def action_clear_input(self):
         """Clear file input and reset state"""
-        file_input = self.query_one("#file-input", Input)
-        file_input.value = ""
+        self._file_input.value = ""
         self.video_info = None
         self.selected_format = None
         self.selected_preset = DEFAULT_PRESET
 
         # Reset UI panels
-        info_panel = self.query_one("#info-panel", VideoInfoPanel)
-        info_panel.update_info(None, None)
-        output_panel = self.query_one("#output-panel", OutputPanel)
-        output_panel.clear()
+        self._info_panel.info = None
+        self._info_panel.preset = None
+        self._output_panel.clear()
 
         # Reset buttons
-        compress_btn = self.query_one("#compress-btn", Button)
-        compress_btn.disabled = True
-        share_btn = self.query_one("#share-btn", Button)
-        share_btn.disabled = True
+        self._compress_btn.disabled = True
+        self._share_btn.disabled = True
 
         # Reset preset selector
-        select = self.query_one("#preset-select", Select)
-        select.value = "social"
-        trim_row = self.query_one("#trim-row")
-        trim_row.remove_class("active")
+        self._preset_select.value = "social"
+        self._trim_row.remove_class("active")
 
         # Reset progress
-        progress_container = self.query_one("#progress-container")
-        progress_container.remove_class("active")
+        self._progress_container.remove_class("active")
 
         self._last_output = None
         self.write_log("[dim]Cleared[/dim]")
 
     def action_clear_log(self):
-        log = self.query_one("#log", StatusLog)
-        log.clear()
+        self._status_log.clear()
         self._log_history.clear()
 
     def action_open_config(self):
@@ -1648,6 +1559,7 @@ class VidToolsApp(App):
     def on_unmount(self):
         if self.watcher:
             self.watcher.stop()
+        self._compress_queue.put(None)
 
 
 def main():
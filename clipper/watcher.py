@@ -1,7 +1,12 @@
 """Watch folder for automatic video processing"""
 
+import os
+import platform
+import re
+import shutil
 import time
 import threading
+from collections import OrderedDict, deque
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
@@ -17,6 +22,7 @@ from .compress import (
     detect_preset_from_filename,
     detect_special_format,
     parse_trim_from_filename,
+    clear_filename_caches,
     DEFAULT_PRESET,
     PRESETS,
     VideoInfo,
@@ -25,6 +31,18 @@ from .compress import (
 )
 from .config import get_config
 
+# Format suffix plus optional trim markers, stripped when naming outputs
+_GIF_SUFFIX_RE = re.compile(r'-gif(-\d+s?(-\d+s?)?)?$', re.IGNORECASE)
+_LOOP_SUFFIX_RE = re.compile(r'-loop(-\d+s?(-\d+s?)?)?$', re.IGNORECASE)
+
+
+def _move(src: Path, dst: Path, cross_device: bool = False) -> None:
+    """Move a file, replacing dst; copy+delete when the folders span filesystems"""
+    if cross_device:
+        shutil.move(src, dst)
+    else:
+        os.replace(src, dst)
+
 
 class JobStatus(Enum):
     QUEUED = "queued"
@@ -54,6 +72,8 @@ class WatchFolders:
     processing: Path
     done: Path
     originals: Path
+    # Whether moves out of inbox/processing cross a filesystem boundary
+    cross_device: bool = False
 
     @classmethod
     def create(cls, base: Path) -> "WatchFolders":
@@ -68,6 +88,12 @@ class WatchFolders:
         folders.processing.mkdir(parents=True, exist_ok=True)
         folders.done.mkdir(parents=True, exist_ok=True)
         folders.originals.mkdir(parents=True, exist_ok=True)
+        # Checked once here so each move picks rename vs copy up front
+        devices = {
+            os.stat(p).st_dev
+            for p in (folders.inbox, folders.processing, folders.originals)
+        }
+        folders.cross_device = len(devices) > 1
         return folders
 
 
@@ -75,27 +101,52 @@ class VideoHandler(FileSystemEventHandler):
     """Handle new video files in inbox"""
 
     VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv", ".webm", ".m4v", ".gif"}
+    TEMP_SUFFIXES = (".part", ".tmp", ".crdownload", ".download")
+    MAX_SEEN = 4096  # Remember this many recent paths for dedup
 
     def __init__(
         self,
-        on_new_file: Callable[[Path], None],
+        on_new_file: Callable[[Path, os.stat_result | None], None],
     ):
         self.on_new_file = on_new_file
-        self._seen: set[Path] = set()
+        self._seen: OrderedDict[str, None] = OrderedDict()
 
     def _is_video(self, path: Path) -> bool:
         return path.suffix.lower() in self.VIDEO_EXTENSIONS
 
+    @classmethod
+    def _is_temp(cls, name: str) -> bool:
+        """Hidden files and in-progress downloads/atomic-save temporaries"""
+        return name.startswith(".") or name.lower().endswith(cls.TEMP_SUFFIXES)
+
     def _handle_file(self, path: Path):
-        if not self._is_video(path):
+        # Reject editor/downloader churn before any stat or settle wait
+        if not self._is_video(path) or self._is_temp(path.name):
             return
-        if path in self._seen:
+        key = os.fspath(path)
+        if key in self._seen:
             return
-        # Wait briefly for file to finish writing
-        time.sleep(0.5)
-        if path.exists():
-            self._seen.add(path)
-            self.on_new_file(path)
+        # Claim the path before settling so repeat events bail out at once
+        self._seen[key] = None
+        if len(self._seen) > self.MAX_SEEN:
+            self._seen.popitem(last=False)
+
+        # Wait for the file to finish writing: poll until its size holds
+        # steady, which is near-instant for small files and still waits out
+        # large copies (capped at ~4s)
+        prev_size = -1
+        for _ in range(40):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                # Gone before it settled - let a later file with this name through
+                self._seen.pop(key, None)
+                return
+            if st.st_size == prev_size and st.st_size > 0:
+                break
+            prev_size = st.st_size
+            time.sleep(0.1)
+        self.on_new_file(path, st)
 
     def on_created(self, event: FileCreatedEvent):
         if not event.is_directory:
@@ -106,11 +157,49 @@ class VideoHandler(FileSystemEventHandler):
             self._handle_file(Path(event.dest_path))
 
 
+# Filesystems that don't deliver native change events to the local kernel
+NETWORK_FS_TYPES = frozenset({"nfs", "nfs4", "cifs", "smbfs", "smb3", "fuse.sshfs"})
+
+
+def _mount_fs_type(path: Path) -> str | None:
+    """Filesystem type of the mount holding path, from /proc/mounts (Linux only)"""
+    try:
+        with open("/proc/mounts") as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return None
+
+    target = os.path.realpath(path)
+    best, fs_type = "", None
+    for mount_point, mount_type in mounts:
+        mount_point = mount_point.replace("\\040", " ")
+        prefix = mount_point.rstrip("/") + "/"
+        if (target == mount_point or target.startswith(prefix)) and len(mount_point) > len(best):
+            best, fs_type = mount_point, mount_type
+    return fs_type
+
+
+def _make_observer(path: Path, poll_interval: float):
+    """Pick the native event backend for path, polling only on network mounts"""
+    system = platform.system()
+    if system == "Darwin":
+        from watchdog.observers.fsevents import FSEventsObserver
+        return FSEventsObserver()
+    if system == "Linux":
+        if _mount_fs_type(path) in NETWORK_FS_TYPES:
+            from watchdog.observers.polling import PollingObserver
+            return PollingObserver(timeout=poll_interval)
+        from watchdog.observers.inotify import InotifyObserver
+        return InotifyObserver()
+    return Observer()
+
+
 class Watcher:
     """
     Watch inbox folder and auto-process videos.
 
-    Uses macOS FSEvents - zero CPU when idle, instant response on file drop.
+    Uses FSEvents on macOS and inotify on Linux - zero CPU when idle, instant
+    response on file drop. Network mounts fall back to polling.
     """
 
     def __init__(
@@ -120,22 +209,27 @@ class Watcher:
         on_job_updated: Callable[[Job], None] | None = None,
         on_job_done: Callable[[Job], None] | None = None,
         delete_source: bool = False,
+        max_workers: int = 1,
     ):
         self.folders = folders
         self.on_job_added = on_job_added
         self.on_job_updated = on_job_updated
         self.on_job_done = on_job_done
         self.delete_source = delete_source
+        # Each worker drives one ffmpeg encode, which already uses every core;
+        # more than one only pays off on machines with cores to spare, so it's
+        # opt-in via folders.max_workers
+        self.max_workers = max(1, max_workers)
 
         self.jobs: list[Job] = []
-        self._queue: list[Job] = []
-        self._lock = threading.Lock()
-        self._processing = False
+        self._queue: deque[Job] = deque()
+        # Workers sleep on this until a job arrives or the watcher stops
+        self._queue_cv = threading.Condition()
+        self._workers: list[threading.Thread] = []
         self._observer: Observer | None = None
-        self._worker_thread: threading.Thread | None = None
         self._stop_event = threading.Event()
 
-    def _on_new_file(self, path: Path):
+    def _on_new_file(self, path: Path, stat_result: os.stat_result | None = None):
         """Called when a new video appears in inbox"""
         # Check for special format and trim points from filename
         special_format, start_time, end_time = parse_trim_from_filename(path)
@@ -150,7 +244,7 @@ class Watcher:
         preset = detect_preset_from_filename(path) or configured_default
 
         try:
-            info = probe_video(path)
+            info = probe_video(path, stat_result)
         except Exception:
             info = None
 
@@ -163,34 +257,24 @@ class Watcher:
             end_time=end_time,
         )
 
-        with self._lock:
-            self.jobs.append(job)
-            self._queue.append(job)
+        self.jobs.append(job)
 
         if self.on_job_added:
             self.on_job_added(job)
 
-        self._maybe_start_processing()
-
-    def _maybe_start_processing(self):
-        """Start processing thread if not already running"""
-        with self._lock:
-            if self._processing or not self._queue:
-                return
-            self._processing = True
-
-        thread = threading.Thread(target=self._process_queue, daemon=True)
-        thread.start()
+        with self._queue_cv:
+            self._queue.append(job)
+            self._queue_cv.notify()
 
-    def _process_queue(self):
-        """Process jobs from queue"""
+    def _worker_loop(self, stop_event: threading.Event):
+        """Pull jobs off the shared queue until the watcher is stopped"""
         while True:
-            with self._lock:
-                if not self._queue or self._stop_event.is_set():
-                    self._processing = False
+            with self._queue_cv:
+                while not self._queue and not stop_event.is_set():
+                    self._queue_cv.wait()
+                if stop_event.is_set():
                     return
-                job = self._queue.pop(0)
-
+                job = self._queue.popleft()
             self._process_job(job)
 
     def _process_job(self, job: Job):
@@ -200,22 +284,33 @@ class Watcher:
             self.on_job_updated(job)
 
         try:
+            # Name parts are fixed for the job's lifetime - parse them once
+            original_name = job.input_path.name
+            original_stem = job.input_path.stem
+
             # Move to processing folder
-            processing_path = self.folders.processing / job.input_path.name
-            job.input_path.rename(processing_path)
+            processing_path = self.folders.processing / original_name
+            _move(job.input_path, processing_path, self.folders.cross_device)
             job.input_path = processing_path
 
+            last_notify = 0.0
+
             def on_progress(p: float):
+                nonlocal last_notify
                 job.progress = p
+                # Coalesce to ~10 Hz so listeners aren't flooded; always pass
+                # the final tick through
+                now = time.monotonic()
+                if p < 1.0 and now - last_notify < 0.1:
+                    return
+                last_notify = now
                 if self.on_job_updated:
                     self.on_job_updated(job)
 
             # Handle special formats (gif, loop) or regular compression
             if job.special_format == "gif":
                 # Remove -gif suffix and time markers for output name
-                import re
-                stem = job.input_path.stem
-                stem = re.sub(r'-gif(-\d+s?(-\d+s?)?)?$', '', stem, flags=re.IGNORECASE)
+                stem = _GIF_SUFFIX_RE.sub('', original_stem)
                 output_path = self.folders.done / f"{stem}.gif"
                 result = convert_to_gif(
                     job.input_path,
@@ -226,9 +321,7 @@ class Watcher:
                 )
             elif job.special_format == "loop":
                 # Remove -loop suffix and time markers for output name
-                import re
-                stem = job.input_path.stem
-                stem = re.sub(r'-loop(-\d+s?(-\d+s?)?)?$', '', stem, flags=re.IGNORECASE)
+                stem = _LOOP_SUFFIX_RE.sub('', original_stem)
                 output_path = self.folders.done / f"{stem}-loop.mp4"
                 result = convert_to_loop(
                     job.input_path,
@@ -239,7 +332,7 @@ class Watcher:
                 )
             else:
                 # Regular compression
-                output_path = self.folders.done / f"{job.input_path.stem}-out.mp4"
+                output_path = self.folders.done / f"{original_stem}-out.mp4"
                 result = compress(
                     job.input_path,
                     output_path=output_path,
@@ -256,7 +349,11 @@ class Watcher:
                 if self.delete_source:
                     job.input_path.unlink()
                 else:
-                    job.input_path.rename(self.folders.originals / job.input_path.name)
+                    _move(
+                        job.input_path,
+                        self.folders.originals / original_name,
+                        self.folders.cross_device,
+                    )
 
         except Exception as e:
             job.status = JobStatus.FAILED
@@ -269,16 +366,41 @@ class Watcher:
 
     def scan_inbox(self):
         """Scan inbox for existing files"""
-        for path in self.folders.inbox.iterdir():
-            if path.suffix.lower() in VideoHandler.VIDEO_EXTENSIONS:
-                self._on_new_file(path)
+        extensions = tuple(VideoHandler.VIDEO_EXTENSIONS)
+        # One readdir pass; filter on the entry name before building Paths,
+        # and hand the entry's stat on so probing doesn't stat again
+        with os.scandir(self.folders.inbox) as entries:
+            for entry in entries:
+                if not entry.name.lower().endswith(extensions) or VideoHandler._is_temp(entry.name):
+                    continue
+                if not entry.is_file():
+                    continue
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                self._on_new_file(Path(entry.path), st)
 
     def start(self):
         """Start watching inbox folder"""
-        self._stop_event.clear()
+        # Fresh event per run so workers from a previous start() can't be revived
+        self._stop_event = threading.Event()
+        self._workers = [
+            threading.Thread(
+                target=self._worker_loop,
+                args=(self._stop_event,),
+                name=f"clipper-job-{i}",
+                daemon=True,
+            )
+            for i in range(self.max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
 
         handler = VideoHandler(on_new_file=self._on_new_file)
-        self._observer = Observer()
+        self._observer = _make_observer(
+            self.folders.inbox, get_config().folders.poll_interval
+        )
         self._observer.schedule(handler, str(self.folders.inbox), recursive=False)
         self._observer.start()
 
@@ -288,11 +410,17 @@ class Watcher:
 
     def stop(self):
         """Stop watching"""
-        self._stop_event.set()
+        # Workers finish the job in hand, then exit; queued jobs stay queued
+        with self._queue_cv:
+            self._stop_event.set()
+            self._queue_cv.notify_all()
+        self._workers = []
         if self._observer:
             self._observer.stop()
             self._observer.join()
             self._observer = None
+        # Bound memory on long-running sessions
+        clear_filename_caches()
 
     @property
     def is_running(self) -> bool: